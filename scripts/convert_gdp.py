@@ -0,0 +1,23 @@
+"""One-shot conversion of the GDP CSV to Parquet with the dtypes the app expects.
+
+Run from the repo root after editing data/gdp_10y_mock.csv:
+
+    $ python scripts/convert_gdp.py
+"""
+from pathlib import Path
+
+import pandas as pd
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+GDP_CSV_PATH = DATA_DIR / "gdp_10y_mock.csv"
+GDP_PARQUET_PATH = DATA_DIR / "gdp_10y_mock.parquet"
+
+
+def main():
+    df = pd.read_csv(GDP_CSV_PATH).astype({"year": "int32", "gdp_usd": "float64"})
+    df.to_parquet(GDP_PARQUET_PATH, engine="pyarrow", index=False)
+    print(f"Wrote {len(df)} rows to {GDP_PARQUET_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,32 +1,56 @@
-import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from string import Template
 import base64
-import requests
 
+import orjson
 import pandas as pd
 import streamlit as st
-import plotly.express as px
+from diskcache import Cache
 
 DATA_DIR = Path(__file__).parent / "data"
 ASSETS_DIR = Path(__file__).parent / "assets"  # optional, for your own logo later
+STATIC_DIR = Path(__file__).parent / "static"  # served at /app/static (see .streamlit/config.toml)
 COUNTRIES_PATH = DATA_DIR / "countries_mock.json"
-GDP_PATH = DATA_DIR / "gdp_10y_mock.csv"
+GDP_PATH = DATA_DIR / "gdp_10y_mock.parquet"  # regenerate with scripts/convert_gdp.py
+FLAG_CACHE_DIR = ASSETS_DIR / ".flag_cache"  # persistent flag store, survives restarts
+FLAG_CACHE_TTL = 30 * 86400  # seconds
+FLAG_EXT = "webp"  # w320 WebP is plenty behind the dark overlay and far smaller than w640 PNG
 
 
 @st.cache_data
 def load_countries():
-    with open(COUNTRIES_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(COUNTRIES_PATH.read_bytes())
+
+
+@st.cache_data
+def countries_index():
+    """Returns ({name: country}, [names], (flag ISO2 codes)) so reruns don't rescan the country list."""
+    countries = load_countries()
+    flag_codes = tuple(
+        code
+        for code in (_norm_iso2(c.get("flag_code") or c.get("iso2")) for c in countries)
+        if code
+    )
+    return {c["name"]: c for c in countries}, [c["name"] for c in countries], flag_codes
 
 
 @st.cache_data
 def load_gdp():
-    df = pd.read_csv(GDP_PATH)
-    df["year"] = df["year"].astype(int)
-    df["gdp_usd"] = df["gdp_usd"].astype(float)
+    # numeric dtypes are baked into the Parquet file, no casts needed
+    df = pd.read_parquet(GDP_PATH, engine="pyarrow")
+    # country repeats once per year; category codes are smaller and compare faster than strings
+    df["country"] = df["country"].astype("category")
     return df
 
 
+@st.cache_data
+def gdp_index():
+    """Returns {country: year-sorted GDP series} so reruns skip the mask + sort."""
+    df = load_gdp().sort_values(["country", "year"])
+    return {k: g.reset_index(drop=True) for k, g in df.groupby("country", sort=False, observed=True)}
+
+
 def fmt_money(x):
     if x is None:
         return "—"
@@ -47,168 +71,189 @@ def fmt_pct(x):
     return f"{float(x):.1f}%"
 
 
-def _img_to_base64(path: Path) -> str:
-    data = path.read_bytes()
-    return base64.b64encode(data).decode("utf-8")
-
-
 def _bytes_to_base64(data: bytes) -> str:
     return base64.b64encode(data).decode("utf-8")
 
 
-def set_page_background(image_path: Path | None):
-    """Sets a full-page background image via CSS. If image_path is None or missing, does nothing."""
-    if image_path is None or not image_path.exists():
-        return
-
-    b64 = _img_to_base64(image_path)
-    ext = image_path.suffix.lower().lstrip(".")
+def _b64_data_uri(b64: str, ext: str = "png") -> str:
+    ext = (ext or "png").lower().lstrip(".")
     if ext == "jpg":
         ext = "jpeg"
+    return f"data:image/{ext};base64,{b64}"
 
-    st.markdown(
-        f"""
-        <style>
-          /* Full app background */
-          .stApp {{
-            background: url("data:image/{ext};base64,{b64}") no-repeat center center fixed;
-            background-size: cover;
-          }}
-
-          /* Slight dark overlay for readability */
-          .stApp:before {{
-            content: "";
-            position: fixed;
-            inset: 0;
-            background: rgba(0,0,0,0.60);
-            pointer-events: none;
-            z-index: 0;
-          }}
-
-          /* Ensure main content stays above overlay */
-          section.main > div {{
-            position: relative;
-            z-index: 1;
-          }}
-
-          /* Make the body/container background transparent */
-          .block-container {{
-            background: transparent !important;
-          }}
-
-          /* Landing hero text styling */
-          .landing-title {{
-            font-size: 54px;
-            line-height: 1.05;
-            font-weight: 750;
-            letter-spacing: -0.02em;
-            margin: 0 0 18px 0;
-            color: rgba(255,255,255,0.95);
-            text-shadow: 0 10px 30px rgba(0,0,0,0.35);
-          }}
-
-          .landing-label {{
-            font-size: 14px;
-            letter-spacing: 0.02em;
-            color: rgba(255,255,255,0.78);
-            margin: 0 0 8px 0;
-          }}
-
-          /* Tighten Streamlit selectbox */
-          div[data-baseweb="select"] > div {{
-            border-radius: 14px !important;
-          }}
-
-          /* Optional logo placement (top-right) */
-          .corner-logo {{
-            position: fixed;
-            top: 18px;
-            right: 18px;
-            width: 110px;
-            z-index: 2;
-            filter: drop-shadow(0 10px 30px rgba(0,0,0,0.35));
-          }}
-
-          /* Right-side panel divider + spacing (dashboard) */
-          .right-panel {{
-            border-left: 2px solid rgba(255,255,255,0.22);
-            padding-left: 24px;
-            margin-left: 6px;
-          }}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+
+@st.cache_data(show_spinner=False)
+def _img_data_uri(path_str: str, mtime: float) -> str:
+    """Reads an image file into a data URI. mtime is part of the cache key so edits invalidate it."""
+    path = Path(path_str)
+    return _b64_data_uri(_bytes_to_base64(path.read_bytes()), path.suffix)
+
+
+# Full-page background + dark overlay. Only the image URI varies between pages.
+_BG_CSS_TEMPLATE = Template("""
+<style>
+  /* Full app background */
+  .stApp {
+    background: url("$uri") no-repeat center center fixed;
+    background-size: cover;
+  }
+
+  /* Slight dark overlay for readability */
+  .stApp:before {
+    content: "";
+    position: fixed;
+    inset: 0;
+    background: rgba(0,0,0,0.60);
+    pointer-events: none;
+    z-index: 0;
+  }
+
+  /* Ensure main content stays above overlay */
+  section.main > div {
+    position: relative;
+    z-index: 1;
+  }
+
+  /* Make the body/container background transparent */
+  .block-container {
+    background: transparent !important;
+  }
+</style>
+""")
 
 
 @st.cache_data(show_spinner=False)
-def fetch_flag_png_iso2(iso2: str) -> bytes | None:
-    """Fetches a flag PNG for an ISO2 code from a public CDN. Returns raw bytes or None."""
+def _bg_css(uri: str) -> str:
+    return _BG_CSS_TEMPLATE.substitute(uri=uri)
+
+
+def set_page_background_uri(uri: str | None):
+    """Sets a full-page background image via CSS from a ready image URI."""
+    if not uri:
+        return
+    st.markdown(_bg_css(uri), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def _flag_disk_cache() -> Cache:
+    """On-disk flag cache shared across reruns, restarts and worker processes."""
+    return Cache(str(FLAG_CACHE_DIR))
+
+
+def _norm_iso2(iso2: str | None) -> str | None:
+    """Normalizes an ISO2 code to lowercase. Returns None if it isn't two characters."""
     if not iso2:
         return None
     code = iso2.strip().lower()
     if len(code) != 2:
         return None
+    return code
+
 
-    # flagcdn uses lowercase ISO2, e.g., https://flagcdn.com/w640/us.png
-    url = f"https://flagcdn.com/w640/{code}.png"
+@st.cache_resource(show_spinner=False)
+def _flag_session():
+    """Shared keep-alive session for flagcdn so prefetch/navigation reuse TLS connections.
+
+    Built on the first disk-cache miss, so requests is only imported when a flag
+    actually has to be downloaded.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=2, backoff_factor=0.2)),
+    )
+    return session
+
+
+def _flag_url(code: str) -> str:
+    # flagcdn uses lowercase ISO2, e.g., https://flagcdn.com/w320/us.webp
+    return f"https://flagcdn.com/w320/{code}.{FLAG_EXT}"
+
+
+def _fetch_flag(code: str, cache: Cache) -> bytes | None:
+    """Disk cache, then CDN, for a normalized ISO2 code. Safe to call from worker threads."""
+    key = f"flag:{code}.{FLAG_EXT}"
+    data = cache.get(key)
+    if data is not None:
+        return data
+
+    url = _flag_url(code)
     headers = {
         "User-Agent": "Mozilla/5.0 (compatible; StreamlitApp/1.0; +https://streamlit.io)",
         "Accept": "image/avif,image/webp,image/apng,image/*,*/*;q=0.8",
     }
 
     try:
-        r = requests.get(url, timeout=12, headers=headers)
+        r = _flag_session().get(url, timeout=12, headers=headers)
         if r.status_code == 200 and r.content:
+            cache.set(key, r.content, expire=FLAG_CACHE_TTL)
+            cache.set(f"flag_b64:{code}.{FLAG_EXT}", _bytes_to_base64(r.content), expire=FLAG_CACHE_TTL)
             return r.content
         return None
     except Exception:
         return None
 
 
-def set_page_background_bytes(image_bytes: bytes | None, ext: str = "png"):
-    """Sets a full-page background image via CSS from raw bytes."""
-    if not image_bytes:
-        return
+def fetch_flag_iso2(iso2: str) -> bytes | None:
+    """Fetches a flag image for an ISO2 code from a public CDN. Returns raw bytes or None.
 
-    b64 = _bytes_to_base64(image_bytes)
-    ext = (ext or "png").lower().lstrip(".")
-    if ext == "jpg":
-        ext = "jpeg"
+    Reads the disk cache first and only then goes to the network. Not memoized in
+    memory; fetch_flag_uri_iso2 is the only in-memory tier.
+    """
+    code = _norm_iso2(iso2)
+    if code is None:
+        return None
+    return _fetch_flag(code, _flag_disk_cache())
 
-    st.markdown(
-        f"""
-        <style>
-          /* Full app background */
-          .stApp {{
-            background: url("data:image/{ext};base64,{b64}") no-repeat center center fixed;
-            background-size: cover;
-          }}
-
-          /* Slight dark overlay for readability */
-          .stApp:before {{
-            content: "";
-            position: fixed;
-            inset: 0;
-            background: rgba(0,0,0,0.60);
-            pointer-events: none;
-            z-index: 0;
-          }}
-
-          /* Ensure main content stays above overlay */
-          section.main > div {{
-            position: relative;
-            z-index: 1;
-          }}
-
-          /* Make the body/container background transparent */
-          .block-container {{
-            background: transparent !important;
-          }}
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+
+@st.cache_resource(show_spinner=False)
+def _prefetch_flags(codes: tuple[str, ...]):
+    """Warms the disk flag cache in the background, once per process."""
+    cache = _flag_disk_cache()
+    ex = ThreadPoolExecutor(max_workers=16, thread_name_prefix="flag-prefetch")
+    futures = [ex.submit(_fetch_flag, code, cache) for code in codes]
+    ex.shutdown(wait=False)
+    return futures
+
+
+def fetch_flag_b64_iso2(iso2: str) -> str | None:
+    """Base64-encoded flag image for an ISO2 code, read from the disk cache when possible."""
+    code = _norm_iso2(iso2)
+    if code is None:
+        return None
+
+    cache = _flag_disk_cache()
+    key = f"flag_b64:{code}.{FLAG_EXT}"
+    b64 = cache.get(key)
+    if b64 is not None:
+        return b64
+
+    data = fetch_flag_iso2(code)
+    if not data:
+        return None
+    # A network miss in _fetch_flag already stored the base64 next to the bytes
+    b64 = cache.get(key)
+    if b64 is None:
+        b64 = _bytes_to_base64(data)
+        cache.set(key, b64, expire=FLAG_CACHE_TTL)
+    return b64
+
+
+@st.cache_data(show_spinner=False)
+def fetch_flag_uri_iso2(iso2: str) -> str:
+    """Ready-to-use data URI for an ISO2 flag, built once per process from the disk-cached base64.
+
+    Raises LookupError when the flag can't be loaded; st.cache_data doesn't memoize
+    exceptions, so a failed fetch is retried on the next call.
+    """
+    b64 = fetch_flag_b64_iso2(iso2)
+    if not b64:
+        raise LookupError(f"flag not available for {iso2!r}")
+    return _b64_data_uri(b64, FLAG_EXT)
 
 
 # ----------------- Styling (minimalist + elegant) -----------------
@@ -267,6 +312,95 @@ GLOBE_SVG = """
 </svg>
 """
 
+LANDING_CSS = """
+<style>
+  /* Landing hero text styling */
+  .landing-title {
+    font-size: 54px;
+    line-height: 1.05;
+    font-weight: 750;
+    letter-spacing: -0.02em;
+    margin: 0 0 18px 0;
+    color: rgba(255,255,255,0.95);
+    text-shadow: 0 10px 30px rgba(0,0,0,0.35);
+  }
+
+  .landing-label {
+    font-size: 14px;
+    letter-spacing: 0.02em;
+    color: rgba(255,255,255,0.78);
+    margin: 0 0 8px 0;
+  }
+
+  /* Tighten Streamlit selectbox */
+  div[data-baseweb="select"] > div {
+    border-radius: 14px !important;
+  }
+
+  /* Optional logo placement (top-right) */
+  .corner-logo {
+    position: fixed;
+    top: 18px;
+    right: 18px;
+    width: 110px;
+    z-index: 2;
+    filter: drop-shadow(0 10px 30px rgba(0,0,0,0.35));
+  }
+</style>
+"""
+
+_DASHBOARD_CSS = """
+<style>
+  /* Solid main content panel */
+  section.main > div > div.block-container {
+    background: rgba(255,255,255,0.96) !important;
+    border: 1px solid rgba(0,0,0,0.08);
+    border-radius: 18px;
+    padding: 28px 28px 18px 28px;
+    box-shadow: 0 18px 70px rgba(0,0,0,0.22);
+  }
+
+  /* Ensure all dashboard text is dark */
+  section.main h1, section.main h2, section.main h3, section.main h4,
+  section.main p, section.main li, section.main label, section.main span {
+    color: rgba(15,15,15,0.95) !important;
+  }
+
+  /* Metric blocks more distinct */
+  div[data-testid="stMetric"] {
+    background: rgba(255,255,255,0.98) !important;
+    padding: 14px 16px !important;
+    border-radius: 14px !important;
+    border: 1px solid rgba(0,0,0,0.06) !important;
+  }
+
+  /* Force metric text colors (some Streamlit versions don't expose stMetricLabel testids reliably) */
+  div[data-testid="stMetric"] * {
+    color: rgba(15,15,15,0.95) !important;
+    opacity: 1 !important;
+  }
+
+  /* Extra safety for known metric testids */
+  div[data-testid="stMetricLabel"],
+  div[data-testid="stMetricValue"],
+  div[data-testid="stMetricDelta"],
+  div[data-testid="stMetricLabel"] *,
+  div[data-testid="stMetricValue"] *,
+  div[data-testid="stMetricDelta"] * {
+    color: rgba(15,15,15,0.95) !important;
+    opacity: 1 !important;
+  }
+
+  /* Right-side panel slightly separated */
+  .st-key-right-panel {
+    border-left: 2px solid rgba(0,0,0,0.12);
+    padding-left: 28px;
+    margin-left: 10px;
+    background: transparent;
+  }
+</style>
+"""
+
 TOURNAMENT_MARK = """
 <svg width="26" height="26" viewBox="0 0 26 26" fill="none" xmlns="http://www.w3.org/2000/svg">
   <path d="M8 6h10v4c0 2.2-1.8 4-4 4h-2c-2.2 0-4-1.8-4-4V6Z" stroke="rgba(0,0,0,0.55)" stroke-width="1.6" stroke-linejoin="round"/>
@@ -281,29 +415,32 @@ TOURNAMENT_MARK = """
 if "selected_country" not in st.session_state:
     st.session_state.selected_country = None
 
-countries = load_countries()
-gdp_df = load_gdp()
-country_names = [c["name"] for c in countries]
+countries_by_name, country_names, flag_codes = countries_index()
+gdp_by_country = gdp_index()
 
 def render_landing():
     # Background should be the globe image (full screen)
-    # Prefer assets/globe_background.(png/jpg/jpeg). Fallback to assets/globe.png.
+    # Prefer static/globe_background.(png/jpg/jpeg). Fallback to static/globe.png.
+    # Served as a plain URL so the browser can cache it instead of decoding inline base64.
     bg = None
     for name in ["globe_background.jpg", "globe_background.jpeg", "globe_background.png", "globe.png"]:
-        p = ASSETS_DIR / name
-        if p.exists():
-            bg = p
+        if (STATIC_DIR / name).exists():
+            bg = f"./app/static/{name}"
             break
 
-    set_page_background(bg)
+    set_page_background_uri(bg)
+    st.markdown(LANDING_CSS, unsafe_allow_html=True)
+
+    # Fetch every flag while the user is still picking a country
+    _prefetch_flags(flag_codes)
 
     # Top-right FIFA logo (if present)
     logo_path = ASSETS_DIR / "fifa_logo.png"
     if logo_path.exists():
-        b64_logo = _img_to_base64(logo_path)
+        logo_uri = _img_data_uri(str(logo_path), logo_path.stat().st_mtime)
         st.markdown(
             f"""
-            <img class="corner-logo" src="data:image/png;base64,{b64_logo}" />
+            <img class="corner-logo" src="{logo_uri}" />
             """,
             unsafe_allow_html=True,
         )
@@ -335,23 +472,12 @@ def render_landing():
         st.rerun()
 
 
-def render_dashboard(selected_name: str):
-    st.title("World Cup Host Feasibility Explorer")
-
-    # Top bar
-    top_left, top_right = st.columns([1, 1], vertical_alignment="center")
-    with top_left:
-        st.write(" ")
-        new_sel = st.selectbox("Country", country_names, index=country_names.index(selected_name))
-        if new_sel != selected_name:
-            st.session_state.selected_country = new_sel
-            st.rerun()
-    with top_right:
-        if st.button("Back to landing"):
-            st.session_state.selected_country = None
-            st.rerun()
-
-    country = next(c for c in countries if c["name"] == selected_name)
+def _build_country_view(selected_name: str) -> dict:
+    """Everything render_dashboard needs for one country: record, GDP series and flag background."""
+    country = countries_by_name[selected_name]
+    flag_uri = None
+    flag_note = None
+    flag_failed = False
 
     # Optional: country-specific background using a locally stored flag image.
     # Add one of these files and a matching code in your JSON (recommended):
@@ -362,72 +488,64 @@ def render_dashboard(selected_name: str):
         # 1) Prefer local asset if you have it
         flag_path = ASSETS_DIR / "flags" / f"{flag_code}.png"
         if flag_path.exists():
-            set_page_background(flag_path)
+            flag_uri = _img_data_uri(str(flag_path), flag_path.stat().st_mtime)
         else:
             # 2) Otherwise fetch from a CDN (cached) so you don't need 193 files
-            flag_bytes = fetch_flag_png_iso2(flag_code)
-            if flag_bytes:
-                set_page_background_bytes(flag_bytes, ext="png")
-            else:
-                st.caption(f"(Flag background not loaded — could not fetch https://flagcdn.com/w640/{flag_code.lower()}.png)")
+            try:
+                flag_uri = fetch_flag_uri_iso2(flag_code)
+            except LookupError:
+                flag_failed = True
+                flag_note = f"(Flag background not loaded — could not fetch {_flag_url(flag_code.lower())})"
     else:
-        st.caption("(No ISO2/flag_code found for this country in countries_mock.json — add iso2 like 'US'.)")
+        flag_note = "(No ISO2/flag_code found for this country in countries_mock.json — add iso2 like 'US'.)"
+
+    return {
+        "country": country,
+        "gdp_series": gdp_by_country.get(selected_name),
+        "flag_uri": flag_uri,
+        "flag_note": flag_note,
+        "flag_failed": flag_failed,
+    }
 
-    # Strong readability layer for dashboard content (ensures visibility on any flag)
-    st.markdown(
-        """
-        <style>
-          /* Solid main content panel */
-          section.main > div > div.block-container {
-            background: rgba(255,255,255,0.96) !important;
-            border: 1px solid rgba(0,0,0,0.08);
-            border-radius: 18px;
-            padding: 28px 28px 18px 28px;
-            box-shadow: 0 18px 70px rgba(0,0,0,0.22);
-          }
-
-          /* Ensure all dashboard text is dark */
-          section.main h1, section.main h2, section.main h3, section.main h4,
-          section.main p, section.main li, section.main label, section.main span {
-            color: rgba(15,15,15,0.95) !important;
-          }
-
-          /* Metric blocks more distinct */
-          div[data-testid="stMetric"] {
-            background: rgba(255,255,255,0.98) !important;
-            padding: 14px 16px !important;
-            border-radius: 14px !important;
-            border: 1px solid rgba(0,0,0,0.06) !important;
-          }
-
-          /* Force metric text colors (some Streamlit versions don't expose stMetricLabel testids reliably) */
-          div[data-testid="stMetric"] * {
-            color: rgba(15,15,15,0.95) !important;
-            opacity: 1 !important;
-          }
-
-          /* Extra safety for known metric testids */
-          div[data-testid="stMetricLabel"],
-          div[data-testid="stMetricValue"],
-          div[data-testid="stMetricDelta"],
-          div[data-testid="stMetricLabel"] *,
-          div[data-testid="stMetricValue"] *,
-          div[data-testid="stMetricDelta"] * {
-            color: rgba(15,15,15,0.95) !important;
-            opacity: 1 !important;
-          }
-
-          /* Right-side panel slightly separated */
-          .right-panel {
-            border-left: 2px solid rgba(0,0,0,0.12);
-            padding-left: 28px;
-            margin-left: 10px;
-            background: transparent;
-          }
-        </style>
-        """,
-        unsafe_allow_html=True,
-    )
+
+def _on_dashboard_country_change():
+    st.session_state.selected_country = st.session_state.dashboard_country
+
+
+def render_dashboard(selected_name: str):
+    st.title("World Cup Host Feasibility Explorer")
+
+    # Top bar
+    top_left, top_right = st.columns([1, 1], vertical_alignment="center")
+    with top_left:
+        st.write(" ")
+        # Stable key (no changing index) so the widget keeps its identity across reruns;
+        # the callback runs before the rerun, so no extra st.rerun() is needed.
+        if st.session_state.get("dashboard_country") != selected_name:
+            st.session_state.dashboard_country = selected_name
+        st.selectbox("Country", country_names, key="dashboard_country", on_change=_on_dashboard_country_change)
+    with top_right:
+        if st.button("Back to landing"):
+            st.session_state.selected_country = None
+            st.rerun()
+
+    # Re-selecting a country this session skips the lookups, disk cache and base64 work
+    view_cache = st.session_state.setdefault("country_cache", {})
+    view = view_cache.get(selected_name)
+    if view is None:
+        view = _build_country_view(selected_name)
+        if not view["flag_failed"]:  # don't pin a failed flag fetch; it's retried next run
+            view_cache[selected_name] = view
+    country = view["country"]
+
+    # Flag background + strong readability layer (ensures visibility on any flag),
+    # sent as a single markdown element so the frontend applies one patch per rerun
+    style_html = _DASHBOARD_CSS
+    if view["flag_uri"]:
+        style_html = _bg_css(view["flag_uri"]) + style_html
+    st.markdown(style_html, unsafe_allow_html=True)
+    if view["flag_note"]:
+        st.caption(view["flag_note"])
 
     left, right = st.columns([1, 1.4], gap="large")
 
@@ -446,16 +564,21 @@ def render_dashboard(selected_name: str):
         st.write("Add airport capacity, hotels, transit, tax, infrastructure indices, etc.")
 
         st.markdown("### GDP trend")
-        series = gdp_df[gdp_df["country"] == selected_name].sort_values("year")
-        if series.empty:
+        series = view["gdp_series"]
+        if series is None or series.empty:
             st.warning("No GDP series found for this country.")
         else:
-            fig = px.line(series, x="year", y="gdp_usd", markers=True, title=None)
-            fig.update_layout(yaxis_title="GDP (USD)", xaxis_title="Year")
-            st.plotly_chart(fig, use_container_width=True)
+            # Vega-Lite via Altair (ships with Streamlit): small spec, keeps the point markers
+            import altair as alt
+
+            chart = alt.Chart(series).mark_line(point=True).encode(
+                x=alt.X("year:O", title="Year"),
+                y=alt.Y("gdp_usd:Q", title="GDP (USD)"),
+            )
+            st.altair_chart(chart, use_container_width=True)
 
-    with right:
-        st.markdown('<div class="right-panel">', unsafe_allow_html=True)
+    # Keyed container renders as .st-key-right-panel, styled by _DASHBOARD_CSS
+    with right, st.container(key="right-panel"):
         st.subheader("World Cup Hosting Feasibility")
 
         st.markdown("### Headline FIFA hosting outputs")
@@ -471,8 +594,6 @@ def render_dashboard(selected_name: str):
         t2.warning("**Fiscal / delivery risk**\n\n(placeholder) debt capacity, cost overrun risk")
         t3.success("**Legacy upside**\n\n(placeholder) tourism, soft power, FDI")
 
-        st.markdown("</div>", unsafe_allow_html=True)
-
 
 # ----------------- Router -----------------
 if st.session_state.selected_country is None: